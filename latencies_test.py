@@ -1,6 +1,8 @@
-import csv
+import atexit
 import logging
 import os
+import queue
+import threading
 import time
 from enum import Enum
 
@@ -37,8 +39,12 @@ class LatencyTest(ScriptStrategyBase):
     execute_interval = 300  # Time interval (in seconds) between market order executions
     delay = 5  # Time delay (in seconds) to avoid multiple requests being sent simultaneously
     csv_file_id = "aws_tokyo"  # Identifier for distinct CSV filenames
+    csv_batch_size = 64  # Maximum number of queued rows written to the CSV file at once
 
     markets = {connector_name: {trading_pair}}
+    base, quote = split_hb_trading_pair(trading_pair)
+    buy_price_multiplier = Decimal(1) - order_spread / Decimal(100)
+    sell_price_multiplier = Decimal(1) + order_spread / Decimal(100)
 
     # Variables to hold state at runtime
     create_timestamp = 0
@@ -46,6 +52,21 @@ class LatencyTest(ScriptStrategyBase):
     delay_timestamp = 0
     order_filled = False
 
+    # Order state names logged to the CSV file
+    _NAME_PENDING_CREATE = OrderState.PENDING_CREATE.name
+    _NAME_CREATED = OrderState.CREATED.name
+    _NAME_PENDING_CANCEL = OrderState.PENDING_CANCEL.name
+    _NAME_CANCELED = OrderState.CANCELED.name
+    _NAME_PENDING_EXECUTE = OrderState.PENDING_EXECUTE.name
+    _NAME_EXECUTED = OrderState.EXECUTED.name
+
+    # CSV rows are queued by the event handlers and written by a background thread
+    csv_header = b"Timestamp,Order_ID,Status\n"
+    _row_q = None
+    _csv_thread = None
+    _csv_stopped = False
+    _csv_fd = None
+
     @property
     def connector(self):
         """Provides easy access to the associated connector."""
@@ -54,7 +75,7 @@ class LatencyTest(ScriptStrategyBase):
     @property
     def timestamp_now(self):
         """Returns the current timestamp in milliseconds."""
-        return int(time.time() * 1e3)
+        return time.time_ns() // 1_000_000
 
     @property
     def filename(self):
@@ -63,38 +84,41 @@ class LatencyTest(ScriptStrategyBase):
 
     def on_tick(self):
         """Called regularly to check for order creation, execution, and cancellation conditions."""
+        now = self.current_timestamp
+
         # Initialize execute_timestamp on the first tick
         if not self.execute_timestamp:
-            self.execute_timestamp = self.current_timestamp + self.execute_interval
+            self.execute_timestamp = now + self.execute_interval
 
         # Prevent further actions if within the delay period
-        if self.current_timestamp < self.delay_timestamp:
+        if now < self.delay_timestamp:
             return
 
         # Cancel any active orders after the delay has passed
-        if self.get_active_orders(self.connector_name):
-            self.delay_timestamp = self.current_timestamp + self.delay
-            self.cancel_all_orders()
+        active_orders = self.get_active_orders(self.connector_name)
+        if active_orders:
+            self.delay_timestamp = now + self.delay
+            self.cancel_all_orders(active_orders)
             return
 
         # Execute market order if conditions are met
-        if self.test_execute_latency and self.current_timestamp > self.execute_timestamp:
-            self.delay_timestamp = self.current_timestamp + self.delay
-            self.execute_timestamp = self.current_timestamp + self.execute_interval
+        if self.test_execute_latency and now > self.execute_timestamp:
+            self.delay_timestamp = now + self.delay
+            self.execute_timestamp = now + self.execute_interval
             self.order_filled = False
             self.place_order(is_maker=False)
             return
 
         # Place a limit order if conditions are met
-        if self.test_create_latency and self.current_timestamp > self.create_timestamp:
-            self.delay_timestamp = self.current_timestamp + self.delay
-            self.create_timestamp = self.current_timestamp + self.create_interval
+        if self.test_create_latency and now > self.create_timestamp:
+            self.delay_timestamp = now + self.delay
+            self.create_timestamp = now + self.create_interval
             self.place_order(is_maker=True)
 
-    def cancel_all_orders(self):
-        """Cancels all active orders on the exchange and logs the pre-transmission timestamp and status."""
-        for order in self.get_active_orders(self.connector_name):
-            self.save_to_csv(self.timestamp_now, order.client_order_id, OrderState.PENDING_CANCEL.name)
+    def cancel_all_orders(self, active_orders):
+        """Cancels the given active orders on the exchange and logs the pre-transmission timestamp and status."""
+        for order in active_orders:
+            self.save_to_csv(self.timestamp_now, order.client_order_id, self._NAME_PENDING_CANCEL)
             self.cancel(self.connector_name, order.trading_pair, order.client_order_id)
 
     def place_order(self, is_maker):
@@ -104,16 +128,17 @@ class LatencyTest(ScriptStrategyBase):
         Args:
         - is_maker (bool): Indicates if the order is a maker (limit) or taker (market) order.
         """
-        order_side = self.get_order_side()
+        bid_price = self.connector.get_price(self.trading_pair, False)
+        order_side = self.get_order_side(bid_price)
         order_type = OrderType.LIMIT if is_maker else OrderType.MARKET
 
         # Determine the order price based on the type and side
         if order_side == TradeType.BUY:
-            current_price = self.connector.get_price(self.trading_pair, False)
-            price_multiplier = Decimal(1 - self.order_spread / 100)
+            current_price = bid_price
+            price_multiplier = self.buy_price_multiplier
         else:
             current_price = self.connector.get_price(self.trading_pair, True)
-            price_multiplier = Decimal(1 + self.order_spread / 100)
+            price_multiplier = self.sell_price_multiplier
 
         order_price = current_price * price_multiplier if is_maker else current_price
 
@@ -136,18 +161,19 @@ class LatencyTest(ScriptStrategyBase):
             self.log_with_clock(logging.INFO, f"Can't create {candidate.order_type} {candidate.order_side} order. "
                                               f"Not enough funds or amount is below threshold")
 
-    def get_order_side(self):
+    def get_order_side(self, bid_price):
         """
         Determines the side (BUY or SELL) for the next order based on the current account balances.
 
+        Args:
+        - bid_price (Decimal): The current bid price used to value the base balance in quote.
+
         Returns:
         - TradeType.BUY or TradeType.SELL depending on which asset balance is higher.
         """
-        base, quote = split_hb_trading_pair(self.trading_pair)
-        base_balance = self.connector.get_balance(base)
-        quote_balance = self.connector.get_balance(quote)
-        current_price = self.connector.get_price(self.trading_pair, False)
-        base_balance_in_quote = base_balance * current_price
+        base_balance = self.connector.get_balance(self.base)
+        quote_balance = self.connector.get_balance(self.quote)
+        base_balance_in_quote = base_balance * bid_price
         return TradeType.BUY if base_balance_in_quote < quote_balance else TradeType.SELL
 
     def send_order_to_exchange(self, candidate):
@@ -160,20 +186,20 @@ class LatencyTest(ScriptStrategyBase):
             order_id = self.sell(self.connector_name, candidate.trading_pair, candidate.amount,
                                  candidate.order_type, candidate.price)
 
-        status = OrderState.PENDING_CREATE if candidate.order_type == OrderType.LIMIT else OrderState.PENDING_EXECUTE
-        self.save_to_csv(time_before_order_sent, order_id, status.name)
+        status = self._NAME_PENDING_CREATE if candidate.order_type == OrderType.LIMIT else self._NAME_PENDING_EXECUTE
+        self.save_to_csv(time_before_order_sent, order_id, status)
 
     def did_create_buy_order(self, event: BuyOrderCreatedEvent):
         """Logs the post-transmission timestamp when a confirmation of buy order created is received."""
-        self.save_to_csv(self.timestamp_now, event.order_id, OrderState.CREATED.name)
+        self.save_to_csv(self.timestamp_now, event.order_id, self._NAME_CREATED)
 
     def did_create_sell_order(self, event: SellOrderCreatedEvent):
         """Logs the post-transmission timestamp when a confirmation of sell order created is received."""
-        self.save_to_csv(self.timestamp_now, event.order_id, OrderState.CREATED.name)
+        self.save_to_csv(self.timestamp_now, event.order_id, self._NAME_CREATED)
 
     def did_cancel_order(self, event: OrderCancelledEvent):
         """Logs the post-transmission timestamp when a confirmation of order cancelled is received."""
-        self.save_to_csv(self.timestamp_now, event.order_id, OrderState.CANCELED.name)
+        self.save_to_csv(self.timestamp_now, event.order_id, self._NAME_CANCELED)
 
     def did_fill_order(self, event: OrderFilledEvent):
         """
@@ -181,17 +207,94 @@ class LatencyTest(ScriptStrategyBase):
         Ensures that only the first fill event for a specific order is logged.
         """
         if not self.order_filled:
-            self.save_to_csv(self.timestamp_now, event.order_id, OrderState.EXECUTED.name)
+            self.save_to_csv(self.timestamp_now, event.order_id, self._NAME_EXECUTED)
             self.order_filled = True
 
     def save_to_csv(self, timestamp, order_id, status):
-        """Appends the provided data to the CSV file. If the file doesn't exist, it creates one."""
-        file_exists = os.path.exists(self.filename)
+        """
+        Queues the provided data to be appended to the CSV file by the background writer thread.
+        Events arriving after on_stop are appended directly, since the writer thread is not restarted.
+        """
+        if self._csv_stopped:
+            self.open_csv()
+            try:
+                os.write(self._csv_fd, f"{timestamp},{order_id},{status}\n".encode())
+            finally:
+                os.close(self._csv_fd)
+                self._csv_fd = None
+            return
+
+        if self._csv_thread is None:
+            self.start_csv_writer()
 
-        with open(self.filename, 'a', newline='') as csvfile:
-            fieldnames = ['Timestamp', 'Order_ID', 'Status']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
+        self._row_q.put((timestamp, order_id, status))
 
-            writer.writerow({'Timestamp': timestamp, 'Order_ID': order_id, 'Status': status})
+    def start_csv_writer(self):
+        """
+        Opens the CSV file and starts the daemon thread that writes queued rows to it.
+        The file is opened here so that errors reach the calling event handler.
+        The writer is also stopped at interpreter exit, so queued rows are written even if on_stop never runs.
+        """
+        self.open_csv()
+        self._row_q = queue.SimpleQueue()
+        self._csv_thread = threading.Thread(target=self._csv_writer_loop, name="latency_test_csv_writer", daemon=True)
+        self._csv_thread.start()
+        atexit.register(self.stop_csv_writer)
+
+    def open_csv(self):
+        """
+        Opens the CSV file once for appending and writes the header if the file is empty.
+        The file is intentionally opened without O_SYNC/O_DSYNC and never fsync'ed: writes go to the OS page cache,
+        as waiting for the disk would add I/O latency to the very measurements this script records.
+        """
+        # O_APPEND makes every write land atomically at the end of the file on POSIX
+        self._csv_fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if os.fstat(self._csv_fd).st_size == 0:
+            os.write(self._csv_fd, self.csv_header)
+
+    def _csv_writer_loop(self):
+        """
+        Waits for queued rows, then drains any other pending rows (up to csv_batch_size)
+        and writes them as one pre-formatted batch.
+        Stops after writing the remaining rows once the None sentinel is received.
+        Failed writes are logged and the thread keeps draining the queue.
+        """
+        try:
+            running = True
+            while running:
+                batch = []
+                row = self._row_q.get()
+                while row is not None:
+                    batch.append(row)
+                    if len(batch) >= self.csv_batch_size:
+                        break
+                    try:
+                        row = self._row_q.get_nowait()
+                    except queue.Empty:
+                        break
+                else:
+                    running = False
+
+                # Each batch is a single append write; don't add an fsync here
+                if batch:
+                    try:
+                        os.write(self._csv_fd, "".join(f"{timestamp},{order_id},{status}\n"
+                                                       for timestamp, order_id, status in batch).encode())
+                    except OSError:
+                        self.logger().error(f"Failed to write {len(batch)} rows to {self.filename}", exc_info=True)
+        finally:
+            os.close(self._csv_fd)
+            self._csv_fd = None
+
+    def stop_csv_writer(self):
+        """Stops the background writer thread, which writes remaining rows and closes the CSV file."""
+        self._csv_stopped = True
+        if self._csv_thread is not None:
+            atexit.unregister(self.stop_csv_writer)
+            self._row_q.put(None)
+            self._csv_thread.join()
+            self._csv_thread = None
+
+    def on_stop(self):
+        """Stops the CSV writer when the strategy is stopped."""
+        self.stop_csv_writer()
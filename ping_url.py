@@ -2,7 +2,9 @@
 Ping URL Script
 
 This script measures the response times of a given URL by sending multiple HTTP GET requests.
-It then provides statistics like average, median, minimum, and maximum response times.
+It then provides statistics like average, median, minimum, maximum, 95th and 99th percentile response times.
+Each timed request is preceded by an untimed warm-up request on the same connection, so the server
+receives 2 x N requests in total. Keep this in mind for endpoints with rate limits.
 
 Usage:
     python ping_url.py <URL>
@@ -12,6 +14,7 @@ Where:
     python ping_url.py https://api.kucoin.com/api/v1/symbols
 
 Note: Adjust the number of pings (variable N) in the script if needed. Default is 10
+      Adjust the interval between pings (variable SPACING) if needed. Default is 1 second
 """
 
 import sys
@@ -19,30 +22,47 @@ import sys
 import requests
 import time
 import statistics
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-def get_response_times_using_time(url, n):
+def ping_once(url, delay):
     """
-    Pings the given URL `n` times and returns the response times using time.time() for timing.
+    Waits `delay` seconds, then sends a single timed GET request and returns its response time in milliseconds.
+    Each call uses its own keep-alive session, and a warm-up request (excluded from the timing) sets up
+    the TCP/TLS connection right before the timed request, so it measures server latency rather than handshakes.
     """
-    times = []
+    time.sleep(delay)
+
+    with requests.Session() as session:
+        session.get(url)  # Warm-up request
+
+        start_time = time.perf_counter_ns()
+        response = session.get(url)
+        response.raise_for_status()  # Raises an exception for HTTP error responses
+        return (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
+
 
-    for i in range(n):
-        time.sleep(1)
+def get_response_times_using_time(url, n, spacing=1):
+    """
+    Pings the given URL `n` times and returns the response times using time.perf_counter_ns() for timing.
+    Requests run concurrently, each one staggered by `spacing` seconds from the previous one,
+    so the total run time doesn't grow with the response times. Use spacing=0 to send them all at once.
+    Every worker has its own warmed-up connection, so overlapping requests never time a new handshake.
+    """
+    times = []
 
-        start_time = time.time()
-        try:
-            response = requests.get(url)
-            response.raise_for_status()  # Raises an exception for HTTP error responses
-        except requests.RequestException as e:
-            print(f"Error during request: {e}")
-            continue
-        elapsed_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-        times.append(elapsed_time)
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = [executor.submit(ping_once, url, (i + 1) * spacing) for i in range(n)]
+        for i, future in enumerate(as_completed(futures)):
+            try:
+                times.append(future.result())
+            except requests.RequestException as e:
+                print(f"Error during request: {e}")
+                continue
 
-        # Print progress
-        progress = ((i + 1) / n) * 100
-        print(f"{progress:.2f}% done")
+            # Print progress
+            progress = ((i + 1) / n) * 100
+            print(f"{progress:.2f}% done")
 
     return times
 
@@ -50,17 +70,26 @@ def get_response_times_using_time(url, n):
 def print_statistics(times, url, n):
     """
     Print statistics based on a list of response times.
+    Median, 95th and 99th percentiles all come from a single statistics.quantiles call.
     """
     average_time = sum(times) / len(times)
     min_time = min(times)
     max_time = max(times)
-    median_time = statistics.median(times)
+    if len(times) == 1:
+        median_time = p95_time = p99_time = times[0]
+    else:
+        percentiles = statistics.quantiles(times, n=100, method='inclusive')
+        median_time = percentiles[49]
+        p95_time = percentiles[94]
+        p99_time = percentiles[98]
 
     print(f"\nResponse time for {url} over {n} requests:")
     print(f"Average: {average_time:.2f} ms")
     print(f"Median: {median_time:.2f} ms")
     print(f"Minimum: {min_time:.2f} ms")
     print(f"Maximum: {max_time:.2f} ms")
+    print(f"95th percentile: {p95_time:.2f} ms")
+    print(f"99th percentile: {p99_time:.2f} ms")
 
 
 if __name__ == "__main__":
@@ -72,6 +101,7 @@ if __name__ == "__main__":
     # Fetch the URL from command line arguments
     URL = sys.argv[1]
     N = 10  # Number of times to ping
+    SPACING = 1  # Time interval (in seconds) between consecutive pings
 
-    times = get_response_times_using_time(URL, N)
+    times = get_response_times_using_time(URL, N, SPACING)
     print_statistics(times, URL, N)